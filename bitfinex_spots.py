@@ -1,59 +1,65 @@
-import websocket
-import json
-import threading
-from time import sleep
+import asyncio
+import websockets
+import orjson
+import logging
+from ws_common import WS_CONNECT_OPTIONS, LazyTickerFeed, set_tcp_nodelay
 
-class BitfinexSpotWebSocket:
-    def __init__(self):
+logger = logging.getLogger(__name__)
+
+# Trailing characters of a Bitfinex heartbeat frame, e.g. [17470,"hb"]
+HEARTBEAT_SUFFIX = ',"hb"]'
+
+# tBTCUSD ticker subscription, encoded once rather than per reconnect
+SUBSCRIBE_MESSAGE = orjson.dumps({
+    "event": "subscribe",
+    "channel": "ticker",
+    "symbol": "tBTCUSD"
+}).decode()
+
+class BitfinexSpotWebSocket(LazyTickerFeed):
+    def __init__(self, repo, exchange_name="BITFINEX-spot"):
+        super().__init__(repo, exchange_name, "BTC/USD")
         self.ws_url = 'wss://api-pub.bitfinex.com/ws/2'
-        self.data = None
-        self.connect()
-
-    def on_open(self):
-        # Subscribe to the ticker for BTC/USD
-        subscribe_message = {
-            "event": "subscribe",
-            "channel": "ticker",
-            "symbol": "tBTCUSD"
-        }
-        self.ws.send(json.dumps(subscribe_message))
-        print("Subscribed to Bitfinex BTC/USD ticker")
+        self.start_ws_thread()
+
+    async def connect(self):
+        while True:
+            try:
+                async with websockets.connect(self.ws_url, **WS_CONNECT_OPTIONS) as ws:
+                    set_tcp_nodelay(ws)
+                    # Subscribe to the ticker for BTC/USD
+                    await ws.send(SUBSCRIBE_MESSAGE)
+                    logger.info("Subscribed to Bitfinex BTC/USD ticker")
+
+                    # recv() raises ConnectionClosed on any close, clean or not,
+                    # so every disconnect goes through the reconnect delay below
+                    while True:
+                        message = await ws.recv()
+                        self.on_message(message)
+
+            except Exception as e:
+                logger.error("Error connecting to Bitfinex WebSocket: %s", e)
+                await asyncio.sleep(5)
 
     def on_message(self, message):
-        message = json.loads(message)
+        # Heartbeats ([CHANNEL_ID,"hb"]) are the most frequent frames; drop them unparsed
+        if message.endswith(HEARTBEAT_SUFFIX):
+            return
+        # Channel updates are JSON arrays; events ({"event": ...}) are not needed
+        if message.startswith('['):
+            self._on_ticker_frame(message)
+
+    def _apply_frame(self, raw):
+        message = orjson.loads(raw)
         if isinstance(message, list) and len(message) > 1:
             # The first element is the channel ID, the second is the data
-            channel_id = message[0]
             data = message[1]
             if isinstance(data, list) and len(data) >= 8:
-                # Extracting relevant data
-                self.data = {
-                    "symbol": "BTC/USD",
-                    "bid_price": float(data[0]),    # Best bid
-                    "ask_price": float(data[2]),    # Best ask
-                    "mark_price": float(data[6]),   # Last price
-                    "volume_24h": float(data[7])    # 24h volume
-                }
-                print("Bitfinex data updated:", self.data)
-
-    def on_error(self, error):
-        print(f"Error: {error}")
-
-    def on_close(self):
-        print("WebSocket closed")
-
-    def connect(self):
-        self.ws = websocket.WebSocketApp(
-            self.ws_url,
-            on_open=lambda ws: self.on_open(),
-            on_message=lambda ws, msg: self.on_message(msg),
-            on_error=lambda ws, err: self.on_error(err),
-            on_close=lambda ws: self.on_close()
-        )
-        # Run the WebSocket in a separate thread
-        thread = threading.Thread(target=self.ws.run_forever)
-        thread.daemon = True
-        thread.start()
-
-    def get_data(self):
-        return self.data
+                # Extracting relevant data (Bitfinex sends JSON numbers, no cast needed)
+                self.data.bid_price = data[0]    # Best bid
+                self.data.ask_price = data[2]    # Best ask
+                self.data.mark_price = data[6]   # Last price
+                self.data.volume_24h = data[7]   # 24h volume
+                logger.debug("Bitfinex data updated: %s", self.data)
+                return True
+        return False
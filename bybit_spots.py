@@ -1,10 +1,15 @@
 from pybit.unified_trading import WebSocket
 import time
+import logging
+from ws_common import PUBLISH_INTERVAL, TickerFeed, get_shared_loop
 
-class BybitSpotWebSocket:
-    def __init__(self):
+logger = logging.getLogger(__name__)
+
+class BybitSpotWebSocket(TickerFeed):
+    def __init__(self, repo, exchange_name="BYBIT-spot"):
+        # The ticker record is shared by both streams
+        super().__init__(repo, exchange_name, "BTCUSDT")
         self.ws = None
-        self.data = {}  # Shared dictionary for storing our desired fields
         self.connect()
 
     def connect(self):
@@ -28,9 +33,9 @@ class BybitSpotWebSocket:
                 depth=50,  # Depth of 50 levels; adjust if needed
                 callback=self.handle_orderbook_data
             )
-            print("Bybit WebSocket connected")
+            logger.info("Bybit WebSocket connected")
         except Exception as e:
-            print(f"Error connecting to Bybit WebSocket: {e}")
+            logger.error("Error connecting to Bybit WebSocket: %s", e)
             time.sleep(5)
             self.connect()
 
@@ -39,16 +44,15 @@ class BybitSpotWebSocket:
             if "data" in message and isinstance(message["data"], dict):
                 data = message["data"]
                 # Update the shared data with ticker values:
-                # mark_price from lastPrice and 24hr volume
-                self.data.update({
-                    "symbol": "BTCUSDT",
-                    "mark_price": float(data.get("lastPrice", 0)),
-                    "volume_24h": float(data.get("volume24h", 0))
-                })
-                # print("Bybit ticker updated:", self.data)
+                # mark_price from lastPrice and 24hr volume.
+                # Bybit sends numbers as strings, so the casts are required.
+                with self._data_lock:
+                    self.data.mark_price = float(data.get("lastPrice", 0))
+                    self.data.volume_24h = float(data.get("volume24h", 0))
+                self._schedule_publish()
         except Exception as e:
-            print(f"Error handling ticker: {e}")
-            print("Message causing error:", message)
+            logger.exception("Error handling Bybit ticker: %s", e)
+            logger.debug("Message causing error: %s", message)
 
     def handle_orderbook_data(self, message):
         try:
@@ -58,16 +62,25 @@ class BybitSpotWebSocket:
                 if "b" in data and data["b"] and "a" in data and data["a"]:
                     best_bid = float(data["b"][0][0])
                     best_ask = float(data["a"][0][0])
-                    self.data.update({
-                        "bid_price": best_bid,
-                        "ask_price": best_ask
-                    })
-                    # print("Bybit orderbook updated:", self.data)
+                    with self._data_lock:
+                        self.data.bid_price = best_bid
+                        self.data.ask_price = best_ask
+                    self._schedule_publish()
                 else:
-                    print("Bid/ask data not available")
+                    logger.debug("Bybit bid/ask data not available")
         except Exception as e:
-            print(f"Error handling orderbook: {e}")
-            print("Message causing error:", message)
+            logger.exception("Error handling Bybit orderbook: %s", e)
+            logger.debug("Message causing error: %s", message)
 
-    def get_data(self):
-        return self.data
+    def _schedule_publish(self):
+        """
+        Schedules a single publish PUBLISH_INTERVAL from now, unless one is pending.
+        pybit calls back on its own thread rather than the shared event loop,
+        so the timer is handed to the loop thread-safely.
+        """
+        with self._data_lock:
+            if self._dirty:
+                return
+            self._dirty = True
+        loop = get_shared_loop()
+        loop.call_soon_threadsafe(loop.call_later, PUBLISH_INTERVAL, self._publish)
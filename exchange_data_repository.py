@@ -1,7 +1,39 @@
 import threading
+import functools
 import time
-from datetime import datetime
-from collections import defaultdict
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Number of updates kept in each per-exchange price history ring buffer
+HISTORY_SIZE = 1024
+# Column order of the price history rows
+HISTORY_COLUMNS = ('mark_price', 'bid_price', 'ask_price', 'volume_24h')
+
+
+@dataclass(slots=True)
+class Ticker:
+    """
+    Latest market snapshot for one symbol on one exchange.
+    Slots keep each record small and make field reads a direct attribute load.
+    """
+    symbol: str
+    mark_price: float = 0.0
+    bid_price: float = 0.0
+    ask_price: float = 0.0
+    volume_24h: float = 0.0
+
+    def copy(self):
+        """Returns a shallow copy of this ticker."""
+        return Ticker(self.symbol, self.mark_price, self.bid_price, self.ask_price, self.volume_24h)
+
+    def has_prices(self):
+        """Returns True once any of the price fields has a non-zero value."""
+        return bool(self.mark_price or self.bid_price or self.ask_price)
+
 
 class ExchangeDataRepository:
     """
@@ -10,18 +42,38 @@ class ExchangeDataRepository:
     and accessed by the UI thread.
     """
     def __init__(self):
-        # Use RLock for thread safety (allows recursive locking by the same thread)
-        self._data_lock = threading.RLock()
+        # Plain Lock for thread safety: no method re-enters it, and callbacks
+        # run on the dispatcher thread outside of it
+        self._data_lock = threading.Lock()
         
         # Main data structure: {symbol: {exchange: ticker_data}}
-        # ticker_data is a dict with keys: mark_price, bid_price, ask_price, volume_24h
+        # ticker_data is a Ticker with fields: mark_price, bid_price, ask_price, volume_24h
         self._ticker_data = defaultdict(dict)
         
-        # Track when each exchange's data was last updated
+        # Immutable copy-on-write view of _ticker_data for lock-free readers.
+        # Writers replace the reference wholesale; it is never mutated in place.
+        self._snapshot = {}
+        
+        # Price history ring buffers: {symbol: {exchange: {'buf': ndarray, 'idx': int}}}
+        # buf holds HISTORY_SIZE rows of HISTORY_COLUMNS, idx counts rows ever written.
+        # Preallocated per exchange, so recording an update never allocates.
+        self._prices = defaultdict(lambda: defaultdict(
+            lambda: {'buf': np.zeros((HISTORY_SIZE, len(HISTORY_COLUMNS)), dtype=np.float64), 'idx': 0}
+        ))
+        
+        # Track when each exchange's data was last updated (time.monotonic() seconds)
         self._last_update = defaultdict(dict)  # {symbol: {exchange: timestamp}}
         
         # List of callback functions to notify when data is updated
         self._update_callbacks = []
+        
+        # Updates waiting to be delivered to the callbacks: (symbol, exchange, ticker_data).
+        # Writers only append here; the dispatcher thread drains it in batches.
+        self._pending = deque()
+        self._pending_event = threading.Event()
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop)
+        self._dispatch_thread.daemon = True
+        self._dispatch_thread.start()
     
     def update_ticker(self, symbol, exchange, ticker_data):
         """
@@ -30,24 +82,52 @@ class ExchangeDataRepository:
         Args:
             symbol (str): Trading pair symbol (e.g., "BTC/USDT")
             exchange (str): Exchange name (e.g., "BYBIT-spot")
-            ticker_data (dict): Ticker data with keys like mark_price, bid_price, etc.
+            ticker_data (Ticker): Ticker data with fields like mark_price, bid_price, etc.
         """
         # Standardize the symbol format
         std_symbol = self._standardize_symbol(symbol)
         
         with self._data_lock:
+            # Resolve the per-symbol dicts once instead of on every access
+            exchange_tickers = self._ticker_data[std_symbol]
+            
             # Store previous data for change detection
-            prev_data = self._ticker_data[std_symbol].get(exchange)
+            prev_data = exchange_tickers.get(exchange)
             
             # Update data with standardized symbol
-            ticker_data['symbol'] = std_symbol
-            self._ticker_data[std_symbol][exchange] = ticker_data
-            self._last_update[std_symbol][exchange] = datetime.now().timestamp()
+            ticker_data.symbol = std_symbol
+            exchange_tickers[exchange] = ticker_data
+            self._last_update[std_symbol][exchange] = time.monotonic()
             
-            # Notify callbacks if price changed
-            if prev_data is None or prev_data.get('mark_price') != ticker_data.get('mark_price'):
-                for callback in self._update_callbacks:
-                    callback(std_symbol, exchange, ticker_data)
+            # Append to the ring buffer in place
+            history = self._prices[std_symbol][exchange]
+            history['buf'][history['idx'] % HISTORY_SIZE] = (
+                ticker_data.mark_price,
+                ticker_data.bid_price,
+                ticker_data.ask_price,
+                ticker_data.volume_24h
+            )
+            history['idx'] += 1
+            
+            # Publish a new snapshot; the reference swap is atomic for readers
+            snapshot = self._snapshot
+            self._snapshot = {
+                **snapshot,
+                std_symbol: {**snapshot.get(std_symbol, {}), exchange: ticker_data}
+            }
+            
+            # Queue a notification if a price or quote changed; callbacks run on the dispatcher thread
+            changed = (
+                prev_data is None
+                or prev_data.mark_price != ticker_data.mark_price
+                or prev_data.bid_price != ticker_data.bid_price
+                or prev_data.ask_price != ticker_data.ask_price
+            )
+            if changed:
+                self._pending.append((std_symbol, exchange, ticker_data))
+        
+        if changed:
+            self._pending_event.set()
     
     def get_ticker(self, symbol, exchange=None):
         """
@@ -58,32 +138,62 @@ class ExchangeDataRepository:
             exchange (str, optional): Exchange name. If None, returns data from all exchanges.
             
         Returns:
-            dict or None: Ticker data for the specified symbol and exchange
+            Ticker, dict or None: Ticker for the specified exchange, or {exchange: Ticker} for all exchanges
         """
         std_symbol = self._standardize_symbol(symbol)
         
+        if exchange:
+            # Lock-free fast path: single-key dict reads are atomic under the GIL
+            exchange_tickers = self._ticker_data.get(std_symbol)
+            if exchange_tickers is None:
+                return None
+            return exchange_tickers.get(exchange)
+        
+        # Copying all exchanges needs the lock for a consistent view
         with self._data_lock:
             if std_symbol not in self._ticker_data:
                 return None
-                
-            if exchange:
-                return self._ticker_data[std_symbol].get(exchange)
-            else:
-                return self._ticker_data[std_symbol].copy()
+            return self._ticker_data[std_symbol].copy()
+    
+    def get_price_history(self, symbol, exchange):
+        """
+        Gets the recorded price history for a symbol on one exchange.
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTC/USDT")
+            exchange (str): Exchange name
+            
+        Returns:
+            numpy.ndarray or None: Array of shape (n, 4), oldest row first, with
+                                   columns in HISTORY_COLUMNS order. At most HISTORY_SIZE rows.
+        """
+        std_symbol = self._standardize_symbol(symbol)
+        
+        with self._data_lock:
+            history = self._prices.get(std_symbol, {}).get(exchange)
+            if history is None:
+                return None
+            
+            buf, idx = history['buf'], history['idx']
+            if idx <= HISTORY_SIZE:
+                return buf[:idx].copy()
+            # Buffer has wrapped: the oldest row sits right after the newest
+            return np.roll(buf, -(idx % HISTORY_SIZE), axis=0)
     
     def get_all_tickers(self):
         """
         Gets all ticker data for all symbols and exchanges.
+        Lock-free: returns the current snapshot, which must be treated as read-only.
         
         Returns:
-            dict: All ticker data
+            dict: All ticker data as {symbol: {exchange: Ticker}}
         """
-        with self._data_lock:
-            return {symbol: data.copy() for symbol, data in self._ticker_data.items()}
+        return self._snapshot
     
     def register_update_callback(self, callback):
         """
         Registers a callback to be notified when ticker data is updated.
+        Callbacks run on the repository's dispatcher thread, in batches.
         
         Args:
             callback (function): Function to call with updated data
@@ -91,6 +201,30 @@ class ExchangeDataRepository:
         """
         self._update_callbacks.append(callback)
     
+    def _dispatch_loop(self):
+        """
+        Delivers queued updates to the registered callbacks, one batch per wake-up.
+        Several updates for the same symbol and exchange within a batch are
+        coalesced, so callbacks only see the latest data.
+        """
+        while True:
+            self._pending_event.wait()
+            self._pending_event.clear()
+            
+            with self._data_lock:
+                pending, self._pending = self._pending, deque()
+            
+            latest = {}
+            for symbol, exchange, ticker_data in pending:
+                latest[(symbol, exchange)] = ticker_data
+            
+            for (symbol, exchange), ticker_data in latest.items():
+                for callback in self._update_callbacks:
+                    try:
+                        callback(symbol, exchange, ticker_data)
+                    except Exception as e:
+                        logger.exception("Error in update callback for %s on %s: %s", symbol, exchange, e)
+    
     def get_arbitrage_opportunities(self, symbol, min_profit_percent=0.5):
         """
         Analyzes current prices across exchanges to find arbitrage opportunities.
@@ -112,55 +246,63 @@ class ExchangeDataRepository:
             exchanges = self._ticker_data[std_symbol]
             
             # Check for stale data (older than 30 seconds)
-            current_time = datetime.now().timestamp()
+            current_time = time.monotonic()
             active_exchanges = {
                 ex: data for ex, data in exchanges.items() 
-                if current_time - self._last_update[std_symbol].get(ex, 0) < 30
+                if current_time - self._last_update[std_symbol].get(ex, float('-inf')) < 30
             }
             
-            # Debug print to see what data is being used for arbitrage
-            print(f"Arbitrage calculation for {std_symbol} using data: {active_exchanges}")
+            # Debug log to see what data is being used for arbitrage
+            logger.debug("Arbitrage calculation for %s using data: %s", std_symbol, active_exchanges)
             
-            # Find arbitrage opportunities
             exchange_list = list(active_exchanges.keys())
-            for i in range(len(exchange_list)):
-                buy_exchange = exchange_list[i]
-                buy_price = active_exchanges[buy_exchange].get('ask_price')
-                
-                if buy_price is None or buy_price == 0:
-                    continue
-                    
-                for j in range(len(exchange_list)):
-                    if i == j:
-                        continue
-                        
-                    sell_exchange = exchange_list[j]
-                    sell_price = active_exchanges[sell_exchange].get('bid_price')
-                    
-                    if sell_price is None or sell_price == 0:
-                        continue
-                    
-                    # Calculate profit percentage
-                    profit_percent = (sell_price - buy_price) / buy_price * 100
-                    
-                    if profit_percent >= min_profit_percent:
-                        opportunities.append({
-                            'symbol': std_symbol,
-                            'buy_exchange': buy_exchange,
-                            'buy_price': buy_price,
-                            'sell_exchange': sell_exchange,
-                            'sell_price': sell_price,
-                            'profit_percent': profit_percent
-                        })
+            if len(exchange_list) < 2:
+                return []
+            
+            # Missing or zero prices are treated as unusable quotes
+            asks = np.array([active_exchanges[ex].ask_price or 0.0 for ex in exchange_list], dtype=np.float64)
+            bids = np.array([active_exchanges[ex].bid_price or 0.0 for ex in exchange_list], dtype=np.float64)
+            valid_asks = asks != 0
+            valid_bids = bids != 0
+            if not valid_asks.any() or not valid_bids.any():
+                return []
+            
+            # Early exit: no pair can beat the best bid against the best ask, and
+            # when nothing qualifies (the common case) the E x E matrix is skipped
+            min_ask = asks[valid_asks].min()
+            max_bid = bids[valid_bids].max()
+            if (max_bid - min_ask) / min_ask * 100 < min_profit_percent:
+                return []
+            
+            # profit[i, j] is the profit of buying on exchange i and selling on exchange j
+            safe_asks = np.where(valid_asks, asks, 1.0)[:, None]
+            profit = (bids[None, :] - safe_asks) / safe_asks * 100
+            profit[~valid_asks, :] = -np.inf
+            profit[:, ~valid_bids] = -np.inf
+            np.fill_diagonal(profit, -np.inf)
+            
+            # Only materialize the pairs that clear the threshold
+            for i, j in np.argwhere(profit >= min_profit_percent):
+                opportunities.append({
+                    'symbol': std_symbol,
+                    'buy_exchange': exchange_list[i],
+                    'buy_price': float(asks[i]),
+                    'sell_exchange': exchange_list[j],
+                    'sell_price': float(bids[j]),
+                    'profit_percent': float(profit[i, j])
+                })
             
             # Sort by profit percentage (highest first)
             opportunities.sort(key=lambda x: x['profit_percent'], reverse=True)
             
         return opportunities
     
-    def _standardize_symbol(self, symbol):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _standardize_symbol(symbol):
         """
         Standardizes symbol format across exchanges.
+        The result is memoized: exchanges only ever send a handful of symbol spellings.
         
         Args:
             symbol (str): The symbol to standardize
@@ -193,93 +335,3 @@ class ExchangeDataRepository:
         
         # If we can't standardize, return as is
         return symbol
-
-
-def update_repository_from_websocket(repo, exchange_ws, exchange_name):
-    """
-    Updates the repository with data from a WebSocket connection.
-    """
-    print(f"Starting update thread for {exchange_name}")
-    connection_attempts = 0
-    
-    # Default symbols for each exchange
-    default_symbols = {
-        "BYBIT-spot": "BTC/USDT",
-        "KRAKEN-spot": "BTC/USD",
-        "HUOBI-spot": "BTC/USDT",
-        "OKX-spot": "BTC/USDT",
-        "BITFINEX-spot": "BTC/USD"
-    }
-    
-    while True:
-        try:
-            data = exchange_ws.get_data()
-            
-            # Special handling for Kraken
-            if exchange_name == "KRAKEN-spot":
-                # Debug what we're getting from Kraken
-                print(f"Kraken data received in update thread: {data}")
-                
-                # If we have no data yet, create a placeholder
-                if data is None:
-                    data = {
-                        "symbol": "BTC/USD",
-                        "mark_price": None,
-                        "bid_price": None,
-                        "ask_price": None,
-                        "volume_24h": None
-                    }
-                
-                # Ensure symbol is set
-                if "symbol" not in data or not data["symbol"]:
-                    data["symbol"] = "BTC/USD"
-                
-                # Ensure all values are numeric and non-zero
-                for key in ["mark_price", "bid_price", "ask_price", "volume_24h"]:
-                    try:
-                        if key in data and data[key] is not None:
-                            data[key] = float(data[key])
-                            # If value is zero, try to get it from another field
-                            if data[key] == 0 and key == "mark_price" and "last" in data:
-                                data[key] = float(data["last"])
-                    except (ValueError, TypeError):
-                        data[key] = None
-            
-            if data:
-                # Add symbol if missing for any exchange
-                if "symbol" not in data or not data["symbol"]:
-                    data["symbol"] = default_symbols.get(exchange_name, "BTC/USDT")
-                
-                symbol = data.get("symbol")
-                
-                # Ensure all required fields exist (with None if missing)
-                required_fields = ["mark_price", "bid_price", "ask_price", "volume_24h"]
-                for field in required_fields:
-                    if field not in data:
-                        data[field] = None
-                
-                # Skip update if all price fields are zero or None
-                if all(data.get(field) in [0, None] for field in ["mark_price", "bid_price", "ask_price"]):
-                    print(f"Skipping update for {exchange_name} - all prices are zero or None")
-                    time.sleep(0.5)
-                    continue
-                
-                # Update repository
-                repo.update_ticker(symbol, exchange_name, data)
-                
-                # Print update occasionally
-                if connection_attempts % 20 == 0:
-                    print(f"Updated {exchange_name} data: {data}")
-            else:
-                # Only log occasionally
-                if connection_attempts % 50 == 0:
-                    print(f"Waiting for data from {exchange_name}...")
-            
-            connection_attempts += 1
-            time.sleep(0.1)
-            
-        except Exception as e:
-            print(f"Error updating repository from {exchange_name}: {e}")
-            import traceback
-            traceback.print_exc()
-            time.sleep(5)
@@ -1,82 +1,96 @@
 import asyncio
 import websockets
-import json
-import gzip
-import threading
-from time import sleep
+import orjson
+import zlib
+import operator
+import logging
+from ws_common import WS_CONNECT_OPTIONS, LazyTickerFeed, set_tcp_nodelay
 
-class HuobiSpotWebSocket:
-    def __init__(self):
-        self.ws_url = "wss://api.huobi.pro/ws"
-        self.data = None
-        self.loop = None
-        self.start_ws_thread()
+logger = logging.getLogger(__name__)
+
+# wbits value telling zlib to expect a gzip header and trailer
+GZIP_WBITS = zlib.MAX_WBITS | 16
 
-    def start_ws_thread(self):
-        def run_async_loop():
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(self.connect())
+# Ticker fields read from every "tick" payload, extracted in one C-level call
+TICK_FIELDS = ("close", "bid", "ask", "amount")
+_get_tick_fields = operator.itemgetter(*TICK_FIELDS)
 
-        thread = threading.Thread(target=run_async_loop)
-        thread.daemon = True
-        thread.start()
+# BTC/USDT ticker subscription, pre-encoded for every (re)connect
+SUBSCRIBE_MESSAGE = orjson.dumps({
+    "sub": "market.btcusdt.ticker",
+    "id": "id1"
+}).decode()
+
+class HuobiSpotWebSocket(LazyTickerFeed):
+    def __init__(self, repo, exchange_name="HUOBI-spot"):
+        super().__init__(repo, exchange_name, "BTCUSDT")
+        self.ws_url = "wss://api.huobi.pro/ws"
+        self.start_ws_thread()
 
     async def connect(self):
         while True:
             try:
-                async with websockets.connect(self.ws_url) as ws:
+                async with websockets.connect(self.ws_url, **WS_CONNECT_OPTIONS) as ws:
+                    set_tcp_nodelay(ws)
                     # Subscribe to BTC/USDT ticker
-                    subscribe_message = {
-                        "sub": "market.btcusdt.ticker",
-                        "id": "id1"
-                    }
-                    await ws.send(json.dumps(subscribe_message))
+                    await ws.send(SUBSCRIBE_MESSAGE)
 
                     while True:
                         try:
-                            message = await ws.recv()
+                            raw = await ws.recv()
                             
                             # Handle binary (gzipped) messages
-                            if isinstance(message, bytes):
+                            if isinstance(raw, bytes):
                                 try:
-                                    message = gzip.decompress(message).decode('utf-8')
+                                    raw = zlib.decompress(raw, GZIP_WBITS)
                                 except Exception as e:
-                                    print(f"Error decompressing message: {e}")
+                                    logger.error("Error decompressing Huobi message: %s", e)
                                     continue
 
-                            # Parse JSON
+                                # Answer heartbeats without parsing them: {"ping":<ts>} -> {"pong":<ts>}
+                                if raw.startswith(b'{"ping":'):
+                                    await ws.send('{"pong":' + raw[8:].decode())
+                                    continue
+                            else:
+                                # Text frame: normalize to bytes for the checks below
+                                raw = raw.encode()
+
+                            # Ticker frames are only stored here; they are parsed once per burst
+                            if b'"tick"' in raw:
+                                self._on_ticker_frame(raw)
+                                continue
+
+                            # Parse other frames (acks, pings) straight from the decompressed bytes
                             try:
-                                data = json.loads(message)
-                            except json.JSONDecodeError:
+                                data = orjson.loads(raw)
+                            except orjson.JSONDecodeError:
                                 continue
 
-                            # Handle ping/pong
+                            # Handle ping/pong frames not caught by the fast path above
                             if "ping" in data:
                                 pong_msg = {"pong": data["ping"]}
-                                await ws.send(json.dumps(pong_msg))
+                                await ws.send(orjson.dumps(pong_msg).decode())
                                 continue
 
-                            # Handle ticker data
-                            if "tick" in data:
-                                tick = data["tick"]
-                                self.data = {
-                                    "symbol": "BTCUSDT",
-                                    "mark_price": float(tick.get("close", 0)),
-                                    "bid_price": float(tick.get("bid", 0)),
-                                    "ask_price": float(tick.get("ask", 0)),
-                                    "volume_24h": float(tick.get("amount", 0))
-                                }
-
                         except Exception as e:
-                            print(f"Error processing message: {e}")
+                            logger.exception("Error processing Huobi message: %s", e)
                             continue
 
             except Exception as e:
-                print(f"WebSocket connection error: {e}")
+                logger.error("Error connecting to Huobi WebSocket: %s", e)
                 await asyncio.sleep(5)
                 continue
 
-    def get_data(self):
-        """Returns the latest ticker data"""
-        return self.data
+    def _apply_frame(self, raw):
+        tick = orjson.loads(raw)["tick"]
+        try:
+            close, bid, ask, amount = _get_tick_fields(tick)
+        except KeyError:
+            # Rare partial payload: fall back to defaults
+            close, bid, ask, amount = (tick.get(field, 0) for field in TICK_FIELDS)
+        # Huobi sends JSON numbers, so no cast is needed
+        self.data.mark_price = close
+        self.data.bid_price = bid
+        self.data.ask_price = ask
+        self.data.volume_24h = amount
+        return True
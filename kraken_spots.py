@@ -1,79 +1,84 @@
 import websockets
-import json
+import orjson
 import asyncio
-import threading
-import time
+import logging
+import operator
+from ws_common import WS_CONNECT_OPTIONS, LazyTickerFeed, set_tcp_nodelay
 
-class KrakenSpotWebSocket:
-    def __init__(self):
+logger = logging.getLogger(__name__)
+
+# Ticker fields read from every update, extracted in one C-level call
+TICKER_FIELDS = ("bid", "ask", "last", "volume")
+_get_ticker_fields = operator.itemgetter(*TICKER_FIELDS)
+
+# Ticker subscription for BTC/USD (WebSocket API v2), built once
+SUBSCRIBE_MESSAGE = orjson.dumps({
+    "method": "subscribe",
+    "params": {
+        "channel": "ticker",
+        "symbol": ["BTC/USD"]
+    }
+}).decode()
+
+class KrakenSpotWebSocket(LazyTickerFeed):
+    def __init__(self, repo, exchange_name="KRAKEN-spot"):
+        super().__init__(repo, exchange_name, "BTC/USD")
         self.ws_url = "wss://ws.kraken.com/v2"  # Updated to v2 endpoint
-        self.data = None
-        self.loop = None
         self.start_ws_thread()
 
     async def connect(self):
         while True:
             try:
-                async with websockets.connect(self.ws_url) as ws:
+                async with websockets.connect(self.ws_url, **WS_CONNECT_OPTIONS) as ws:
+                    set_tcp_nodelay(ws)
                     # Subscribe message for BTC/USD ticker
-                    subscribe_message = {
-                        "method": "subscribe",
-                        "params": {
-                            "channel": "ticker",
-                            "symbol": ["BTC/USD"]
-                        }
-                    }
-                    await ws.send(json.dumps(subscribe_message))
-                    print("Kraken WebSocket connected")
+                    await ws.send(SUBSCRIBE_MESSAGE)
+                    logger.info("Kraken WebSocket connected")
                     
                     while True:
                         message = await ws.recv()
-                        await self.handle_message(json.loads(message))
+                        await self.handle_message(message)
 
             except Exception as e:
-                print(f"Error connecting to Kraken WebSocket: {e}")
+                logger.error("Error connecting to Kraken WebSocket: %s", e)
                 await asyncio.sleep(5)
 
     async def handle_message(self, message):
-        try:
-            # Debug the raw message
-            print(f"Kraken raw message: {message}")
-            
-            if isinstance(message, dict) and 'data' in message:
-                data = message['data'][0]  # First element contains ticker data
-                
-                # Create a new data dictionary with proper values
-                self.data = {
-                    "symbol": "BTC/USD",
-                    "bid_price": float(data.get('bid', 0)),
-                    "ask_price": float(data.get('ask', 0)),
-                    "mark_price": float(data.get('last', 0)),
-                    "volume_24h": float(data.get('volume', 0))
-                }
-                
-                # Ensure we have non-zero values
-                if self.data["mark_price"] == 0 and data.get('last'):
-                    self.data["mark_price"] = float(data.get('last'))
-                
-                # Debug the processed data
-                print(f"Kraken processed data: {self.data}")
+        # Debug the raw message (only formatted when DEBUG is enabled)
+        logger.debug("Kraken raw message: %s", message)
+        
+        # Heartbeats and status frames are dropped unparsed; ticker frames are
+        # only stored here and parsed once per burst
+        if '"ticker"' in message:
+            self._on_ticker_frame(message)
 
-        except Exception as e:
-            print(f"Error handling Kraken message: {e}")
-            import traceback
-            traceback.print_exc()
-
-    def start_ws_thread(self):
-        def run_async_loop():
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(self.connect())
-
-        thread = threading.Thread(target=run_async_loop)
-        thread.daemon = True
-        thread.start()
+    def _apply_frame(self, raw):
+        message = orjson.loads(raw)
+        # Subscription acks mention the ticker channel but carry no data
+        if not isinstance(message, dict) or message.get('channel') != 'ticker' or 'data' not in message:
+            return False
+        data = message['data'][0]  # First element contains ticker data
+        
+        try:
+            bid, ask, last, volume = _get_ticker_fields(data)
+        except KeyError:
+            # Rare partial payload: fall back to defaults
+            bid, ask, last, volume = (data.get(field, 0) for field in TICKER_FIELDS)
+        
+        # Update the ticker record in place (v2 sends JSON numbers, no cast needed)
+        self.data.bid_price = bid
+        self.data.ask_price = ask
+        self.data.mark_price = last
+        self.data.volume_24h = volume
+        
+        # Debug the processed data
+        logger.debug("Kraken processed data: %s", self.data)
+        return True
 
     def get_data(self):
-        # Add a debug print to see what data is being returned
-        print(f"Kraken get_data returning: {self.data}")
-        return self.data
+        """Returns a copy of the latest ticker data, or None before any price has arrived"""
+        data = super().get_data()
+        if not data.has_prices():
+            data = None
+        logger.debug("Kraken get_data returning: %s", data)
+        return data
@@ -1,5 +1,8 @@
 import tkinter as tk
-from time import sleep
+from tkinter import ttk
+from time import monotonic
+import operator
+import queue
 import threading
 import logging
 from kraken_spots import KrakenSpotWebSocket
@@ -7,81 +10,105 @@ from bybit_spots import BybitSpotWebSocket
 from bitfinex_spots import BitfinexSpotWebSocket
 from okx_spots import OKXSpotWebSocket
 from huobi_spots import HuobiSpotWebSocket
-from exchange_data_repository import ExchangeDataRepository, update_repository_from_websocket
+from exchange_data_repository import ExchangeDataRepository
+
+logger = logging.getLogger(__name__)
 
 # Constants
 COLUMNS = ['Symbol', 'Exchange', 'Mark Price', 'Volume 24h', 'Bid Price', 'Ask Price']
+FLUSH_INTERVAL_MS = 20  # How often queued ticker updates are rendered
+FLUSH_BATCH_LIMIT = 1000  # Most queued updates taken per flush, so a burst cannot stall Tk
+HIGHLIGHT_SECONDS = 0.5  # How long a changed cell stays highlighted
+ARBITRAGE_DEBOUNCE_MS = 50  # Delay from the first quote change to the scan; later changes in the window share it
+ARBITRAGE_MIN_PROFIT_PERCENT = 0.2
+
+# Display formatter per numeric Ticker field, in column order after Symbol and Exchange.
+# Feeds preallocate every field as 0.0, so zero means "not received yet" and shows as N/A.
+_FMT = {
+    'mark_price': lambda v: f"${v}" if v else "N/A",
+    'volume_24h': lambda v: f"{v} BTC" if v else "N/A",
+    'bid_price': lambda v: f"${v}" if v else "N/A",
+    'ask_price': lambda v: f"${v}" if v else "N/A",
+}
+# (column index, formatter) for the numeric columns, resolved once
+# here rather than re-enumerated on every render
+NUMERIC_COLS = tuple(enumerate(_FMT.values(), 2))
+# Reads all numeric fields of a Ticker as one tuple, in NUMERIC_COLS order
+_get_numeric_fields = operator.attrgetter(*_FMT)
 
 class CryptoSpreadsheet(tk.Frame):
     def __init__(self, parent):
         tk.Frame.__init__(self, parent)
-        self.entries = {}
-        self.original_colors = {}
-        self.symbol_exchange_row_mapping = {}  # Maps "symbol:exchange" to row
-        self.free_rows = []
-        self.current_row = 1
         self.highlight_colors = {
             'increase': '#c8e6c9',  # Light green
             'decrease': '#ffcdd2',  # Light red
             'neutral': '#ffffff'    # White
         }
+        
+        # Ticker updates waiting to be rendered: (symbol, exchange, data), where
+        # data is None for a row reserved before any ticker arrived.
+        # Filled from other threads, drained by _flush on the Tk thread.
+        self._pending = queue.SimpleQueue()
+        # Highlighted rows and when to reset them: {row id: monotonic deadline}
+        self._highlight_expiry = {}
+        # Last rendered ticker per row, kept numeric so changes are compared as floats
+        # rather than re-parsed from the formatted cell text: {(symbol, exchange): Ticker}
+        self._last_numeric = {}
+        # Last rendered cell text per row, so unchanged fields are not re-formatted:
+        # {(symbol, exchange): [column values]}
+        self._last_values = {}
+        # Treeview item id per row: {(symbol, exchange): "symbol:exchange"}.
+        # Built once per row, so updates neither format the id nor ask Tk whether it exists.
+        self._row_ids = {}
+        # Functions run on the Tk thread at the end of every flush
+        self._flush_callbacks = []
 
         # Style configuration
-        self.header_style = {
-            'font': ('Arial', 10, 'bold'),
-            'bg': '#2c3e50',
-            'fg': 'white',
-            'width': 20,
-            'readonlybackground': '#2c3e50'
-        }
-        
-        self.cell_style = {
-            'font': ('Arial', 10),
-            'bg': '#ffffff',
-            'fg': '#2c3e50',
-            'width': 20,
-            'readonlybackground': '#ffffff'
-        }
+        style = ttk.Style(self)
+        style.configure(
+            'Crypto.Treeview',
+            font=('Arial', 10),
+            background='#ffffff',
+            fieldbackground='#ffffff',
+            foreground='#2c3e50',
+            rowheight=24
+        )
+        style.configure(
+            'Crypto.Treeview.Heading',
+            font=('Arial', 10, 'bold'),
+            background='#2c3e50',
+            foreground='white'
+        )
+
+        # A single Treeview renders the whole table instead of one Entry per cell
+        self.tree = ttk.Treeview(self, columns=COLUMNS, show='headings', style='Crypto.Treeview')
+        for col in COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=150, anchor='w')
+        for highlight_type, color in self.highlight_colors.items():
+            self.tree.tag_configure(highlight_type, background=color)
 
-        # Create scrollable frame
-        self.canvas = tk.Canvas(self, bg='#ffffff')
-        self.frame = tk.Frame(self.canvas, bg='#ffffff')
-        self.vsb = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.hsb = tk.Scrollbar(self, orient="horizontal", command=self.canvas.xview)
-        self.canvas.configure(yscrollcommand=self.vsb.set, xscrollcommand=self.hsb.set)
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.hsb = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(yscrollcommand=self.vsb.set, xscrollcommand=self.hsb.set)
 
-        # Pack scrollbars and canvas
+        # Pack scrollbars and table
         self.vsb.pack(side="right", fill="y")
         self.hsb.pack(side="bottom", fill="x")
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.canvas.create_window((0, 0), window=self.frame, anchor="nw")
+        self.tree.pack(side="left", fill="both", expand=True)
 
-        self.frame.bind("<Configure>", self.onFrameConfigure)
-        self.create_headers()
+        self.after(FLUSH_INTERVAL_MS, self._flush)
 
-    def onFrameConfigure(self, event):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
-    def create_headers(self):
-        for col, header in enumerate(COLUMNS):
-            entry = tk.Entry(self.frame, **self.header_style)
-            entry.grid(row=0, column=col, padx=1, pady=1, sticky='nsew')
-            entry.insert(0, header)
-            entry.config(state='readonly')
-            self.entries[(0, col)] = entry
-            self.original_colors[(0, col)] = self.header_style['bg']
-
-    def add_row(self):
-        row = self.current_row
-        for col in range(len(COLUMNS)):
-            entry = tk.Entry(self.frame, **self.cell_style)
-            entry.grid(row=row, column=col, padx=1, pady=1, sticky='nsew')
-            entry.config(state='readonly')  # Make cell read-only
-            self.entries[(row, col)] = entry
-            self.original_colors[(row, col)] = self.cell_style['bg']
-        self.free_rows.append(row)
-        self.current_row += 1
-        return row
+    def add_flush_callback(self, callback):
+        """
+        Registers a function to run on the Tk thread at the end of every UI flush.
+        Lets other widgets pick up work handed over from other threads without
+        running a timer of their own.
+        
+        Args:
+            callback (function): Function taking no arguments
+        """
+        self._flush_callbacks.append(callback)
 
     def get_row(self, symbol, exchange):
         """
@@ -93,102 +120,154 @@ class CryptoSpreadsheet(tk.Frame):
             exchange (str): The exchange name
             
         Returns:
-            int: The row number
+            str: The row's item id, "symbol:exchange"
         """
-        key = f"{symbol}:{exchange}"
-        if key not in self.symbol_exchange_row_mapping:
-            if self.free_rows:
-                row = self.free_rows.pop(0)
-            else:
-                row = self.add_row()
-            self.symbol_exchange_row_mapping[key] = row
-            # Set symbol and exchange
-            self.update_cell(row, 0, symbol)
-            self.update_cell(row, 1, exchange)
-        return self.symbol_exchange_row_mapping[key]
+        row = self._row_ids.get((symbol, exchange))
+        if row is None:
+            row = f"{symbol}:{exchange}"
+            if not self.tree.exists(row):
+                self.tree.insert('', 'end', iid=row, values=(symbol, exchange, '', '', '', ''))
+            self._row_ids[(symbol, exchange)] = row
+        return row
 
-    def _compare_numeric_values(self, current_value, new_value):
-        try:
-            current_num = float(current_value.replace('$', '').replace(' BTC', ''))
-            new_num = float(str(new_value).replace('$', '').replace(' BTC', ''))
-            
-            if current_num == 0:
-                return 'neutral'
-            return 'increase' if new_num > current_num else 'decrease' if new_num < current_num else 'neutral'
-        except (ValueError, AttributeError):
-            return 'neutral'
+    def update_row(self, row, values, highlight_type=None):
+        """
+        Replaces a row's values, and its highlight if given, in one Treeview call.
+        
+        Args:
+            row (str): The row's item id
+            values (tuple): New values, one per column
+            highlight_type (str, optional): 'increase', 'decrease' or 'neutral' to flash the row
+        """
+        if highlight_type is None:
+            self.tree.item(row, values=values)
+            return
+        
+        # Values and highlight tag go to Tcl in a single item configure
+        self.tree.item(row, values=values, tags=(highlight_type,))
+        # Reset by the next _flush after the deadline instead of one after() per row
+        self._highlight_expiry[row] = monotonic() + HIGHLIGHT_SECONDS
 
-    def _get_highlight_type(self, col, current_value, new_value):
-        if col in [2, 3, 4, 5]:  # Mark Price, Volume, Bid, Ask columns
-            return self._compare_numeric_values(current_value, new_value)
-        return 'neutral'
+    def reset_row_color(self, row):
+        self.tree.item(row, tags=())
 
-    def update_cell(self, row, col, value, highlight=True):
-        entry = self.entries.get((row, col))
-        if entry:
-            current_value = entry.get()
-            if str(current_value) != str(value):
-                highlight_type = self._get_highlight_type(col, current_value, value)
-                
-                entry.config(state='normal')
-                entry.delete(0, tk.END)
-                entry.insert(0, value)
-                entry.config(state='readonly')
-                
-                if highlight:
-                    self.highlight_cell(row, col, highlight_type)
+    def update_from_repository(self, symbol, exchange, data):
+        """
+        Queues data from the repository for the next UI flush.
+        This is called by the repository when new data is available.
+        
+        Args:
+            symbol (str): Trading pair symbol
+            exchange (str): Exchange name
+            data (Ticker): Ticker data
+        """
+        self._pending.put((symbol, exchange, data))
 
-    def highlight_cell(self, row, col, highlight_type):
-        entry = self.entries.get((row, col))
-        if entry:
-            original_color = self.original_colors[(row, col)]
-            highlight_color = self.highlight_colors[highlight_type]
-            entry.config(state='normal', readonlybackground=highlight_color)
-            entry.config(state='readonly')
-            self.after(500, lambda: self.reset_cell_color(entry, original_color))
+    def reserve_row(self, symbol, exchange):
+        """
+        Queues an empty row for a symbol and exchange so it shows before any data arrives.
+        Safe to call from any thread: the row is created by the next UI flush.
+        
+        Args:
+            symbol (str): Trading pair symbol
+            exchange (str): Exchange name
+        """
+        self._pending.put((symbol, exchange, None))
 
-    def reset_cell_color(self, entry, original_color):
-        entry.config(state='normal', readonlybackground=original_color)
-        entry.config(state='readonly')
+    def _flush(self):
+        """
+        Renders queued updates on the Tk thread, then re-arms itself.
+        Several updates for the same symbol and exchange collapse into one render
+        of the latest data, and expired row highlights are reset in the same pass.
+        """
+        get_pending = self._pending.get_nowait
+        latest = {}
+        for _ in range(FLUSH_BATCH_LIMIT):
+            try:
+                symbol, exchange, data = get_pending()
+            except queue.Empty:
+                break
+            # A row reservation never replaces real data for the same row
+            if data is not None or (symbol, exchange) not in latest:
+                latest[(symbol, exchange)] = data
+        
+        # Bound methods and dicts used per row are looked up once per flush
+        render_update = self._render_update
+        get_row = self.get_row
+        for (symbol, exchange), data in latest.items():
+            if data is None:
+                get_row(symbol, exchange)
+            else:
+                render_update(symbol, exchange, data)
+        
+        highlight_expiry = self._highlight_expiry
+        if highlight_expiry:
+            now = monotonic()
+            expired = [row for row, deadline in highlight_expiry.items() if deadline <= now]
+            reset_row_color = self.reset_row_color
+            for row in expired:
+                del highlight_expiry[row]
+                reset_row_color(row)
+        
+        for callback in self._flush_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.exception("Error in flush callback: %s", e)
+        
+        self.after(FLUSH_INTERVAL_MS, self._flush)
 
-    def update_from_repository(self, symbol, exchange, data):
+    def _render_update(self, symbol, exchange, data):
         """
-        Updates the UI with data from the repository.
-        This is called by the repository when new data is available.
+        Writes one ticker update into its row.
         
         Args:
             symbol (str): Trading pair symbol
             exchange (str): Exchange name
-            data (dict): Ticker data
+            data (Ticker): Ticker data
         """
         try:
-            # Get or create a row for this symbol and exchange
-            row = self.get_row(symbol, exchange)
+            # Skip the render entirely if nothing changed since the last one
+            key = (symbol, exchange)
+            last_numeric = self._last_numeric
+            prev = last_numeric.get(key)
+            if prev == data:
+                return
             
-            # Format values with fallbacks for missing data
-            mark_price = data.get('mark_price')
-            mark_price_str = f"${mark_price}" if mark_price is not None else "N/A"
+            # Read every numeric field in one call instead of one attribute access each
+            fields = _get_numeric_fields(data)
+            prev_fields = _get_numeric_fields(prev) if prev is not None else None
             
-            volume = data.get('volume_24h')
-            volume_str = f"{volume} BTC" if volume is not None else "N/A"
+            # Highlight by the mark price move, compared as raw floats
+            highlight_type = 'neutral'
+            mark_price = fields[0]
+            if prev_fields is not None and prev_fields[0] and mark_price is not None:
+                if mark_price > prev_fields[0]:
+                    highlight_type = 'increase'
+                elif mark_price < prev_fields[0]:
+                    highlight_type = 'decrease'
+            last_numeric[key] = data
             
-            bid_price = data.get('bid_price')
-            bid_price_str = f"${bid_price}" if bid_price is not None else "N/A"
+            # Get or create a row for this symbol and exchange
+            row = self.get_row(symbol, exchange)
             
-            ask_price = data.get('ask_price')
-            ask_price_str = f"${ask_price}" if ask_price is not None else "N/A"
+            # Format only the fields whose value changed since the last render
+            last_values = self._last_values
+            values = last_values.get(key)
+            if values is None or prev_fields is None:
+                values = [symbol, exchange] + [fmt(value) for (_, fmt), value in zip(NUMERIC_COLS, fields)]
+                last_values[key] = values
+            else:
+                for (col, fmt), value, prev_value in zip(NUMERIC_COLS, fields, prev_fields):
+                    if value != prev_value:
+                        values[col] = fmt(value)
             
-            # Update cells with formatted values
-            self.update_cell(row, 2, mark_price_str)
-            self.update_cell(row, 3, volume_str)
-            self.update_cell(row, 4, bid_price_str)
-            self.update_cell(row, 5, ask_price_str)
+            # Update the whole row with formatted values
+            self.update_row(row, tuple(values), highlight_type)
             
-            print(f"Updated UI for {symbol} on {exchange} with {data}")
+            logger.debug("Updated UI for %s on %s with %s", symbol, exchange, data)
         except Exception as e:
-            print(f"Error updating UI from repository for {symbol} on {exchange}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error updating UI from repository for %s on %s: %s", symbol, exchange, e)
 
 
 # Create a class for displaying arbitrage opportunities
@@ -223,6 +302,85 @@ class ArbitrageFrame(tk.Frame):
         self.scrollbar.pack(side='right', fill='y')
         self.text_area.config(yscrollcommand=self.scrollbar.set)
         self.scrollbar.config(command=self.text_area.yview)
+        
+        # Repository scanned for opportunities, set by watch_repository
+        self._repo = None
+        # Symbols whose quotes changed, filled from the repository thread and
+        # drained by _scan on the Tk thread
+        self._changed_symbols = queue.SimpleQueue()
+        # Set on the repository thread when a symbol is queued, read on the Tk thread
+        self._scan_requested = threading.Event()
+        # True while a _scan is scheduled; only touched on the Tk thread
+        self._scan_armed = False
+        # Last seen (bid, ask) per (symbol, exchange); only used on the repository thread
+        self._last_quotes = {}
+        # Latest opportunities per symbol, combined for display
+        self._opportunities_by_symbol = {}
+    
+    def watch_repository(self, repo):
+        """
+        Rescans for opportunities whenever a bid or ask in the repository changes.
+        Safe to call from any thread.
+        
+        Args:
+            repo (ExchangeDataRepository): The repository to watch
+        """
+        self._repo = repo
+        repo.register_update_callback(self.on_repository_update)
+    
+    def on_repository_update(self, symbol, exchange, data):
+        """
+        Marks a symbol for rescanning if its quote on this exchange changed.
+        Called on the repository's dispatcher thread, so it makes no Tk calls.
+        
+        Args:
+            symbol (str): Trading pair symbol
+            exchange (str): Exchange name
+            data (Ticker): Ticker data
+        """
+        quote = (data.bid_price, data.ask_price)
+        key = (symbol, exchange)
+        if self._last_quotes.get(key) == quote:
+            return
+        self._last_quotes[key] = quote
+        self._changed_symbols.put(symbol)
+        self._scan_requested.set()
+    
+    def check_scan_request(self):
+        """
+        Schedules one scan ARBITRAGE_DEBOUNCE_MS from now if a quote changed and no
+        scan is pending. Must be called on the Tk thread (see add_flush_callback).
+        A burst of updates across exchanges therefore triggers a single scan.
+        """
+        if self._scan_armed or not self._scan_requested.is_set():
+            return
+        self._scan_requested.clear()
+        self._scan_armed = True
+        self.after(ARBITRAGE_DEBOUNCE_MS, self._scan)
+    
+    def _scan(self):
+        """Rescans the symbols whose quotes changed since the last scan."""
+        self._scan_armed = False
+        changed = set()
+        get_changed = self._changed_symbols.get_nowait
+        while True:
+            try:
+                changed.add(get_changed())
+            except queue.Empty:
+                break
+        
+        if changed:
+            try:
+                for symbol in changed:
+                    self._opportunities_by_symbol[symbol] = self._repo.get_arbitrage_opportunities(
+                        symbol, min_profit_percent=ARBITRAGE_MIN_PROFIT_PERCENT
+                    )
+                
+                opportunities = [opp for opps in self._opportunities_by_symbol.values() for opp in opps]
+                opportunities.sort(key=lambda x: x['profit_percent'], reverse=True)
+                self.update_opportunities(opportunities)
+            except Exception as e:
+                logger.exception("Error checking for arbitrage: %s", e)
     
     def update_opportunities(self, opportunities):
         """
@@ -262,97 +420,65 @@ def run_with_repository(spreadsheet, arbitrage_frame=None):
     
     # Register UI update callback
     repo.register_update_callback(spreadsheet.update_from_repository)
-    print("Registered UI update callback")
+    logger.info("Registered UI update callback")
     
     # Register arbitrage callback if arbitrage frame is provided
     if arbitrage_frame:
-        def check_for_arbitrage():
-            while True:
-                try:
-                    # Check for arbitrage opportunities
-                    symbols = ["BTC/USDT", "BTC/USD"]
-                    for symbol in symbols:
-                        opportunities = repo.get_arbitrage_opportunities(symbol, min_profit_percent=0.2)
-                        if opportunities:
-                            # Update the arbitrage frame in the main thread
-                            arbitrage_frame.after(0, lambda opps=opportunities: arbitrage_frame.update_opportunities(opps))
-                    sleep(5)  # Check every 5 seconds
-                except Exception as e:
-                    print(f"Error checking for arbitrage: {e}")
-                    sleep(5)
-        
-        # Start arbitrage checking thread
-        arbitrage_thread = threading.Thread(target=check_for_arbitrage)
-        arbitrage_thread.daemon = True
-        arbitrage_thread.start()
+        arbitrage_frame.watch_repository(repo)
+        spreadsheet.add_flush_callback(arbitrage_frame.check_scan_request)
+        logger.info("Registered arbitrage update callback")
     
     try:
-        print("Initializing exchange WebSockets...")
-        # Create WebSocket instances with better error handling
-        exchanges = []
-        
+        logger.info("Initializing exchange WebSockets...")
+        # Create WebSocket instances with better error handling.
+        # Each one pushes its ticker updates straight into the repository.
         try:
-            bybit_ws = BybitSpotWebSocket()
-            exchanges.append((bybit_ws, "BYBIT-spot"))
-            print("Successfully initialized Bybit WebSocket")
+            BybitSpotWebSocket(repo, "BYBIT-spot")
+            logger.info("Successfully initialized Bybit WebSocket")
         except Exception as e:
-            print(f"Error initializing Bybit WebSocket: {e}")
+            logger.exception("Error initializing Bybit WebSocket: %s", e)
         
         try:
-            kraken_ws = KrakenSpotWebSocket()
-            exchanges.append((kraken_ws, "KRAKEN-spot"))
-            print("Successfully initialized Kraken WebSocket")
+            KrakenSpotWebSocket(repo, "KRAKEN-spot")
+            logger.info("Successfully initialized Kraken WebSocket")
         except Exception as e:
-            print(f"Error initializing Kraken WebSocket: {e}")
+            logger.exception("Error initializing Kraken WebSocket: %s", e)
         
         try:
-            huobi_ws = HuobiSpotWebSocket()
-            exchanges.append((huobi_ws, "HUOBI-spot"))
-            print("Successfully initialized Huobi WebSocket")
+            HuobiSpotWebSocket(repo, "HUOBI-spot")
+            logger.info("Successfully initialized Huobi WebSocket")
         except Exception as e:
-            print(f"Error initializing Huobi WebSocket: {e}")
+            logger.exception("Error initializing Huobi WebSocket: %s", e)
         
         try:
-            okx_ws = OKXSpotWebSocket()
-            exchanges.append((okx_ws, "OKX-spot"))
-            print("Successfully initialized OKX WebSocket")
+            OKXSpotWebSocket(repo, "OKX-spot")
+            logger.info("Successfully initialized OKX WebSocket")
         except Exception as e:
-            print(f"Error initializing OKX WebSocket: {e}")
+            logger.exception("Error initializing OKX WebSocket: %s", e)
         
         try:
-            bitfinex_ws = BitfinexSpotWebSocket()
-            exchanges.append((bitfinex_ws, "BITFINEX-spot"))
-            print("Successfully initialized Bitfinex WebSocket")
+            BitfinexSpotWebSocket(repo, "BITFINEX-spot")
+            logger.info("Successfully initialized Bitfinex WebSocket")
         except Exception as e:
-            print(f"Error initializing Bitfinex WebSocket: {e}")
-        
-        # Start threads to update the repository from each WebSocket
-        threads = []
-        for ws, name in exchanges:
-            thread = threading.Thread(
-                target=update_repository_from_websocket,
-                args=(repo, ws, name)
-            )
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-            print(f"Started update thread for {name}")
+            logger.exception("Error initializing Bitfinex WebSocket: %s", e)
         
         # Manually create initial rows for all exchanges to ensure they appear in UI
         for exchange_name in ["BYBIT-spot", "KRAKEN-spot", "HUOBI-spot", "OKX-spot", "BITFINEX-spot"]:
             for symbol in ["BTC/USDT", "BTC/USD"]:
-                try:
-                    # This ensures a row is created for each exchange, even before data arrives
-                    row = spreadsheet.get_row(symbol, exchange_name)
-                    print(f"Created initial row for {symbol} on {exchange_name}: row {row}")
-                except Exception as e:
-                    print(f"Error creating row for {symbol} on {exchange_name}: {e}")
+                # This ensures a row is created for each exchange, even before data arrives.
+                # The row is built on the Tk thread; this function runs on a worker thread.
+                spreadsheet.reserve_row(symbol, exchange_name)
         
     except Exception as e:
-        print(f"Error setting up WebSockets: {e}")
+        logger.exception("Error setting up WebSockets: %s", e)
 
 
 def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+
     root = tk.Tk()
     root.title("Crypto Exchange Data")
     root.geometry("1200x600")
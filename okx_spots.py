@@ -1,72 +1,62 @@
 import asyncio
 import websockets
-import json
-import threading
-from time import sleep
-
-class OKXSpotWebSocket:
-    def __init__(self):
+import orjson
+import logging
+from ws_common import WS_CONNECT_OPTIONS, TickerFeed, set_tcp_nodelay
+
+logger = logging.getLogger(__name__)
+
+# Static BTC-USDT spot tickers subscription, serialized once at import
+SUBSCRIBE_MESSAGE = orjson.dumps({
+    "op": "subscribe",
+    "args": [
+        {
+            "channel": "tickers",
+            "instType": "SPOT",
+            "instId": "BTC-USDT"
+        }
+    ]
+}).decode()
+
+class OKXSpotWebSocket(TickerFeed):
+    def __init__(self, repo, exchange_name="OKX-spot"):
+        super().__init__(repo, exchange_name, "BTC-USDT")
         self.ws_url = "wss://ws.okx.com:8443/ws/v5/public"
-        self.data = None
-        self.loop = None
         self.start_ws_thread()
 
-    def start_ws_thread(self):
-        def run_async_loop():
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(self.connect())
-
-        thread = threading.Thread(target=run_async_loop)
-        thread.daemon = True
-        thread.start()
-
     async def connect(self):
         while True:
             try:
-                async with websockets.connect(self.ws_url) as ws:
+                async with websockets.connect(self.ws_url, **WS_CONNECT_OPTIONS) as ws:
+                    set_tcp_nodelay(ws)
                     # Subscribe to the ticker for BTC-USDT
-                    subscribe_message = {
-                        "op": "subscribe",
-                        "args": [
-                            {
-                                "channel": "tickers",
-                                "instType": "SPOT",
-                                "instId": "BTC-USDT"
-                            }
-                        ]
-                    }
-                    await ws.send(json.dumps(subscribe_message))
-                    print("OKX WebSocket connected")
+                    await ws.send(SUBSCRIBE_MESSAGE)
+                    logger.info("OKX WebSocket connected")
                     
                     while True:
                         message = await ws.recv()
-                        await self.handle_message(json.loads(message))
+                        await self.handle_message(orjson.loads(message))
 
             except Exception as e:
-                print(f"Error connecting to OKX WebSocket: {e}")
+                logger.error("Error connecting to OKX WebSocket: %s", e)
                 await asyncio.sleep(5)
 
     async def handle_message(self, message):
         try:
             # Check if the message contains data
             if 'data' in message and isinstance(message['data'], list) and len(message['data']) > 0:
-                ticker_data = message['data'][0]
-                if self.data is None:
-                    self.data = {}
-
-                # Extract relevant data
-                self.data.update({
-                    "symbol": "BTC-USDT",
-                    "mark_price": float(ticker_data.get('last', 0)),  # Last price
-                    "bid_price": float(ticker_data.get('bidPx', 0)),  # Best bid price
-                    "ask_price": float(ticker_data.get('askPx', 0)),  # Best ask price
-                    "volume_24h": float(ticker_data.get('vol24h', 0))  # 24h volume
-                })
-                # print("OKX data updated:", self.data)
+                td = message['data'][0]
+                d = self.data
+
+                # Extract relevant data (OKX sends numbers as strings, so cast them)
+                with self._data_lock:
+                    d.mark_price = float(td.get('last', 0))     # Last price
+                    d.bid_price = float(td.get('bidPx', 0))     # Best bid price
+                    d.ask_price = float(td.get('askPx', 0))     # Best ask price
+                    d.volume_24h = float(td.get('vol24h', 0))   # 24h volume
+                # Publish at a bounded rate rather than once per message
+                self._schedule_publish()
+                logger.debug("OKX data updated: %s", d)
 
         except Exception as e:
-            print(f"Error handling OKX message: {e}")
-
-    def get_data(self):
-        return self.data
+            logger.exception("Error handling OKX message: %s", e)
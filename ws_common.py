@@ -0,0 +1,213 @@
+import asyncio
+import socket
+import threading
+import logging
+from abc import ABC, abstractmethod
+from exchange_data_repository import Ticker
+
+try:
+    # libuv-based event loop, noticeably faster socket I/O than the default selector loop
+    import uvloop
+except ImportError:  # Not available on Windows; fall back to the stdlib loop
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between two repository publishes from one exchange feed.
+# Ticks arriving in between are coalesced and only the latest is published.
+PUBLISH_INTERVAL = 0.1
+
+# Options for every websockets.connect() call. Ticker frames are small, so
+# permessage-deflate costs an inflate per frame without saving bandwidth;
+# dead connections are detected by websockets' own keepalive pings.
+WS_CONNECT_OPTIONS = {
+    "compression": None,
+    "ping_interval": 20,
+    "ping_timeout": 10,
+    "max_size": 2 ** 20
+}
+
+# Single event loop shared by every asyncio-based exchange WebSocket
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+
+def get_shared_loop():
+    """
+    Returns the event loop shared by the asyncio-based exchange WebSockets.
+    The loop is created on first use (a uvloop loop when uvloop is installed)
+    and runs forever in one daemon thread.
+    
+    Returns:
+        asyncio.AbstractEventLoop: The shared event loop
+    """
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            thread = threading.Thread(target=_shared_loop.run_forever, name="ws-event-loop")
+            thread.daemon = True
+            thread.start()
+        return _shared_loop
+
+
+def run_on_shared_loop(coro):
+    """
+    Schedules a coroutine on the shared event loop. Safe to call from any thread.
+    
+    Args:
+        coro (coroutine): The coroutine to run
+        
+    Returns:
+        concurrent.futures.Future: Future holding the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_shared_loop())
+
+
+def set_tcp_nodelay(ws):
+    """
+    Ensures TCP_NODELAY is set on a connected WebSocket's TCP socket.
+    asyncio and uvloop already enable it on every TCP transport; this only
+    makes the low-latency setting explicit, in case a transport does not.
+    
+    Args:
+        ws: An open websockets connection
+    """
+    sock = ws.transport.get_extra_info('socket')
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        pass  # Not a TCP socket (e.g. a proxy or test transport)
+
+
+class TickerFeed(ABC):
+    """
+    Shared state and bounded-rate publishing for one exchange ticker feed.
+    Subclasses implement connect() and write parsed prices into self.data
+    under _data_lock, then call _schedule_publish().
+    """
+    def __init__(self, repo, exchange_name, symbol):
+        self.repo = repo
+        self.exchange_name = exchange_name
+        # Preallocated ticker record, updated in place on every message
+        self.data = Ticker(symbol)
+        self._data_lock = threading.Lock()
+        # True while an update is waiting for the scheduled publish
+        self._dirty = False
+        self.loop = None
+
+    def start_ws_thread(self):
+        # Run on the event loop shared with the other exchange WebSockets
+        self.loop = get_shared_loop()
+        run_on_shared_loop(self.connect())
+
+    @abstractmethod
+    async def connect(self):
+        """
+        Connects to the exchange and keeps the feed running, reconnecting on errors.
+        asyncio-based feeds implement it as a coroutine, which start_ws_thread()
+        schedules on the shared event loop.
+        """
+
+    def _schedule_publish(self):
+        """
+        Schedules a single publish PUBLISH_INTERVAL from now, unless one is pending.
+        Must be called on the shared event loop.
+        """
+        if not self._dirty:
+            self._dirty = True
+            self.loop.call_later(PUBLISH_INTERVAL, self._publish)
+
+    def get_data(self):
+        """Returns a copy of the latest ticker data"""
+        with self._data_lock:
+            return self.data.copy()
+
+    def _publish(self):
+        """
+        Pushes a snapshot of the latest ticker data into the repository.
+        Nothing is pushed while every price is still zero (no quote received yet).
+        """
+        with self._data_lock:
+            self._dirty = False
+            if not self.data.has_prices():
+                return
+            data = self.data.copy()
+        self.repo.update_ticker(data.symbol, self.exchange_name, data)
+
+
+class LazyTickerFeed(TickerFeed):
+    """
+    TickerFeed that keeps only the newest raw ticker frame and parses it on
+    demand: when the scheduled publish fires or get_data() is called. Frames
+    superseded in between are never parsed. Subclasses implement _apply_frame().
+    """
+    def __init__(self, repo, exchange_name, symbol):
+        super().__init__(repo, exchange_name, symbol)
+        # Newest ticker frame not yet decoded into self.data
+        self._latest_raw = None
+        # True once self.data holds decoded values the repository has not seen yet
+        self._unpublished = False
+
+    def _on_ticker_frame(self, raw):
+        """Stores a raw ticker frame, replacing any undecoded one, and schedules a publish."""
+        with self._data_lock:
+            self._latest_raw = raw
+        self._schedule_publish()
+
+    @abstractmethod
+    def _apply_frame(self, raw):
+        """
+        Parses one raw ticker frame into self.data. Called with _data_lock held.
+        
+        Args:
+            raw (str or bytes): The frame passed to _on_ticker_frame
+            
+        Returns:
+            bool: True if self.data was updated
+        """
+
+    def _decode_latest(self):
+        """
+        Decodes the pending ticker frame into self.data. Caller must hold _data_lock.
+        
+        Returns:
+            bool: True if self.data was updated. Also marks it for the next publish.
+        """
+        raw = self._latest_raw
+        if raw is None:
+            return False
+        self._latest_raw = None
+
+        try:
+            updated = self._apply_frame(raw)
+        except Exception as e:
+            logger.exception("Error decoding %s ticker frame: %s", self.exchange_name, e)
+            return False
+        if updated:
+            self._unpublished = True
+        return updated
+
+    def get_data(self):
+        """Returns a copy of the latest ticker data, decoding any pending frame first"""
+        with self._data_lock:
+            self._decode_latest()
+            return self.data.copy()
+
+    def _publish(self):
+        """
+        Decodes the newest ticker frame and pushes it into the repository.
+        Data already decoded by an earlier get_data() call is published as well.
+        """
+        with self._data_lock:
+            self._dirty = False
+            self._decode_latest()
+            if not self._unpublished:
+                return
+            self._unpublished = False
+            if not self.data.has_prices():
+                return
+            data = self.data.copy()
+        self.repo.update_ticker(data.symbol, self.exchange_name, data)